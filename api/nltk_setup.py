@@ -3,29 +3,50 @@ import ssl
 import os
 import sys
 
-# Set up SSL context for NLTK downloads
-try:
-    _create_unverified_https_context = ssl._create_unverified_context
-except AttributeError:
-    pass
-else:
-    ssl._create_default_https_context = _create_unverified_https_context
-
-# Ensure NLTK_DATA directory exists
-nltk_data_dir = os.environ.get('NLTK_DATA', '/tmp/nltk_data')
-os.makedirs(nltk_data_dir, exist_ok=True)
-
-print(f"Downloading NLTK data to: {nltk_data_dir}")
-
-# Download required NLTK data packages
-try:
+# NLTK data bundled with the deployment artifact, next to the api/ directory.
+# Nothing in the request path needs punkt anymore (keywords no longer come from
+# newspaper3k's article.nlp()), so this script only runs when explicitly enabled
+# at build time and never downloads anything on a cold start.
+bundled_nltk_data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nltk_data")
+
+def setup_nltk_data():
+    """Make punkt available from the bundled data directory, downloading it only if missing"""
+    nltk_data_dir = os.environ.get('NLTK_DATA', bundled_nltk_data_dir)
+    if nltk_data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, nltk_data_dir)
+
+    # Already bundled, nothing to download
+    try:
+        nltk.data.find('tokenizers/punkt')
+        print(f"NLTK punkt data found in: {nltk_data_dir}")
+        return
+    except LookupError:
+        pass
+
+    # Set up SSL context for NLTK downloads
+    try:
+        _create_unverified_https_context = ssl._create_unverified_context
+    except AttributeError:
+        pass
+    else:
+        ssl._create_default_https_context = _create_unverified_https_context
+
+    # Ensure NLTK_DATA directory exists
+    os.makedirs(nltk_data_dir, exist_ok=True)
+
+    print(f"Downloading NLTK data to: {nltk_data_dir}")
+
     # punkt is needed by newspaper3k for sentence tokenization
     nltk.download('punkt', download_dir=nltk_data_dir, quiet=False)
-    
+
     # Optional: download additional NLTK data that might be useful
     # nltk.download('stopwords', download_dir=nltk_data_dir, quiet=False)
-    
+
     print("NLTK data downloaded successfully!")
-except Exception as e:
-    print(f"Error downloading NLTK data: {e}", file=sys.stderr)
-    sys.exit(1)
+
+if __name__ == '__main__':
+    try:
+        setup_nltk_data()
+    except Exception as e:
+        print(f"Error downloading NLTK data: {e}", file=sys.stderr)
+        sys.exit(1)
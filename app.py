@@ -1,6 +1,8 @@
-from flask import Flask, jsonify, request
+from flask import Flask, request
 from flask_cors import CORS
-from gnews import GNews
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+import feedparser
 import newspaper
 from newspaper import Article
 import os
@@ -9,9 +11,26 @@ import json
 import re
 from datetime import datetime
 import time
-import traceback
+import logging
+import hashlib
+import threading
+import redis
+from cachetools import TTLCache
+import httpx
+import orjson
+import trafilatura
+import lxml.html
+from lxml import etree
+from collections import Counter
 from functools import lru_cache  # Import LRU Cache for caching results
-from googlenewsdecoder.decoderv1 import decode_google_news_url
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse, urljoin, quote
+import base64
+
+try:
+    import hyperscan  # Optional: speeds up the byline scan when installed
+except ImportError:
+    hyperscan = None
 
 # Load environment variables
 load_dotenv()
@@ -34,109 +53,266 @@ CORS(app, resources={
 # Enable debugging for development
 app.config['DEBUG'] = True
 
-# Simple in-memory cache for news results
-news_cache = {}
+# Per-article details are logged at DEBUG, so they cost nothing unless explicitly enabled
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO if app.config['DEBUG'] else logging.WARNING)
+
+# Shared Redis cache for news results. Serverless instances lose their memory on
+# every cold start, so Redis is used whenever REDIS_URL is configured. Short socket
+# timeouts make an unreachable Redis a quick cache miss instead of a hung request
+redis_url = os.environ.get('REDIS_URL')
+redis_timeout = 0.5  # Seconds allowed to connect to Redis or wait on a reply
+redis_client = redis.Redis.from_url(
+    redis_url,
+    socket_connect_timeout=redis_timeout,
+    socket_timeout=redis_timeout
+) if redis_url else None
+
+# Per-client rate limiting for the expensive endpoints, with counters kept in the
+# same Redis as the cache so the limit holds across instances. Like the caches, it
+# degrades to in-memory counters instead of failing requests when Redis is down
+limiter = Limiter(
+    get_remote_address,
+    app=app,
+    storage_uri=redis_url or 'memory://',
+    storage_options={'socket_connect_timeout': redis_timeout, 'socket_timeout': redis_timeout},
+    swallow_errors=True,
+    in_memory_fallback_enabled=True
+)
+
+# In-memory cache for news results (used when Redis isn't configured). Entries expire
+# lazily on access and the size is bounded, so no per-request cleanup scan is needed
 cache_expiry = 300  # Cache results for 5 minutes (300 seconds)
+news_cache = TTLCache(maxsize=1024, ttl=cache_expiry)
+news_cache_lock = threading.Lock()  # TTLCache isn't thread-safe
+article_cache_expiry = 86400  # Cache per-URL article details for a day (articles rarely change)
+
+# Settings for concurrent article detail fetching
+# Maximum parallel article downloads across all requests. High enough to hide network
+# latency, low enough to avoid tripping publishers' rate limits; tune per deployment
+article_fetch_workers = int(os.environ.get('NEWS_FETCH_CONCURRENCY', 8))
+article_fetch_timeout = 8  # Seconds to wait for the whole batch of article details
+article_request_timeout = 5  # Seconds allowed for a single article, including resolving its Google News link
+article_text_limit = 1500  # Only the start of each article is used (1000 chars returned, the rest feeds keywords)
+article_user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+
+# Shared worker pool for outbound article downloads, so concurrent /news requests
+# reuse the same threads instead of each one spinning up its own pool
+article_executor = ThreadPoolExecutor(max_workers=article_fetch_workers, thread_name_prefix='article-fetch')
+
+# Google News RSS search URL (what GNews used to fetch for us, one fresh connection per search)
+google_news_rss_template = "https://news.google.com/rss/search?q={query}&hl={language}&gl={country}&ceid={country}:{language}"
+feed_request_timeout = httpx.Timeout(5, connect=2)  # Fail fast when news.google.com can't be reached
+feed_fetch_retries = 2  # Extra attempts after a connection error, timeout or gateway error
+feed_retry_backoff = 0.2  # Seconds before the first retry, doubled for each one after
+feed_retry_statuses = frozenset([502, 503, 504])
+
+# One HTTP client for the Google News feed and all article downloads. It is thread-safe
+# and keeps connections alive between requests, and HTTP/2 multiplexes requests to hosts
+# shared by many articles, instead of paying a new TCP+TLS handshake for every URL
+http_client = httpx.Client(
+    http2=True,
+    timeout=httpx.Timeout(article_request_timeout),
+    follow_redirects=True,
+    headers={'User-Agent': article_user_agent}
+)
+
+def _time_left(deadline):
+    """Seconds remaining before a time.monotonic() deadline, for use as a request timeout"""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise httpx.TimeoutException("Article time budget exhausted")
+    return remaining
+
+def _redis_news_key(cache_key):
+    """Flatten a news cache key tuple into a Redis key string"""
+    return "news:" + "_".join(str(part) for part in cache_key)
+
+def news_etag(body):
+    """Hash an encoded news body into an ETag value"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+def get_cached_news(cache_key):
+    """Return the cached (JSON body, ETag) pair for a search argument tuple, or None on a cache miss"""
+    if redis_client is not None:
+        try:
+            body, etag = redis_client.hmget(_redis_news_key(cache_key), 'body', 'etag')
+        except redis.RedisError as e:
+            logger.warning("Redis cache read error: %s", e)
+            return None
+        if body is None or etag is None:
+            return None
+        return body, etag.decode('ascii')
+
+    # Fall back to the in-memory cache when Redis isn't configured
+    with news_cache_lock:
+        return news_cache.get(cache_key)
+
+def set_cached_news(cache_key, body, etag):
+    """Store an encoded JSON body and its ETag for a search argument tuple, letting Redis handle expiry when available"""
+    if redis_client is not None:
+        try:
+            redis_key = _redis_news_key(cache_key)
+            pipe = redis_client.pipeline()
+            pipe.hset(redis_key, mapping={'body': body, 'etag': etag})
+            pipe.expire(redis_key, cache_expiry)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning("Redis cache write error: %s", e)
+        return
+
+    with news_cache_lock:
+        news_cache[cache_key] = (body, etag)
+
+# Common words that indicate what follows is likely a journalist name
+journalist_indicators = [
+    r'by\s+',
+    r'written\s+by\s+', 
+    r'reported\s+by\s+',
+    r'author[:\s]+',
+    r'correspondent[:\s]+',
+    r'staff\s+writer[:\s]+',
+    r'byline[:\s]+',
+    r'\|\s+'  # Common separator in some news sites
+]
+
+# More precise patterns that must include proper structure of a name
+name_patterns = [
+    # Matches common name formats with proper capitalization
+    r'[A-Z][a-z]+(?:\s+[A-Z]\.?\s+)?[A-Z][a-z]+(?:-[A-Z][a-z]+)?',  # First (Middle) Last(-Last)
+    r'[A-Z][a-z]+\s+[a-z]+\s+[A-Z][a-z]+',  # First van/de/la Last
+]
+
+# Words that, if found in the match, likely indicate it's not a person's name
+false_positives = frozenset([
+    'news', 'times', 'post', 'reuters', 'associated', 'press', 'agency',
+    'today', 'yesterday', 'tomorrow', 'google', 'facebook', 'twitter',
+    'breaking', 'exclusive', 'update', 'latest', 'report', 'copyright'
+])
+
+# False positives are substring checks, so match them all in one regex pass
+false_positive_pattern = re.compile("|".join(re.escape(fp) for fp in sorted(false_positives)), re.IGNORECASE)
+
+# The words of every indicator except the separator. A name can't start with one,
+# otherwise "| Written by Jane Doe" would capture "Written" as the name
+journalist_indicator_words = [
+    r'written\s+by',
+    r'reported\s+by',
+    r'by',
+    r'author',
+    r'correspondent',
+    r'staff\s+writer',
+    r'byline'
+]
+
+# All indicators and name formats fused into a single pattern, so each text region
+# is scanned once. The lookahead stops a separator from capturing the indicator of
+# a following byline ("| By", "| Author:", "| Staff Writer:") as the name
+journalist_pattern = re.compile(
+    "(?:" + "|".join(journalist_indicators) + ")"
+    + "((?!(?:" + "|".join(journalist_indicator_words) + r")\b)(?:" + "|".join(name_patterns) + "))",
+    re.IGNORECASE
+)
 
-# Cache cleanup function
-def cleanup_cache():
-    current_time = time.time()
-    keys_to_remove = []
-    for key, (timestamp, _) in news_cache.items():
-        if current_time - timestamp > cache_expiry:
-            keys_to_remove.append(key)
+def _compile_journalist_prefilter():
+    """Compile the byline pattern into a Hyperscan database, or return None without Hyperscan"""
+    if hyperscan is None:
+        return None
     
-    for key in keys_to_remove:
-        del news_cache[key]
+    # Hyperscan has no lookarounds or capture groups, so compile the plain
+    # indicator + name pattern. It matches a superset of journalist_pattern,
+    # which is all a prefilter needs. UTF-8 + UCP make \s match Unicode spaces
+    # like re does (bylines often put a non-breaking space after "By")
+    expression = "(?:" + "|".join(journalist_indicators) + ")(?:" + "|".join(name_patterns) + ")"
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[expression.encode()],
+            ids=[0],
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP]
+        )
+        return database
+    except hyperscan.error as e:
+        logger.warning("Hyperscan byline prefilter unavailable: %s", e)
+        return None
 
-def extract_journalist(title, content=None):
-    """Attempt to extract journalist name if it exists in the title or content"""
-    # Common words that indicate what follows is likely a journalist name
-    journalist_indicators = [
-        r'by\s+',
-        r'written\s+by\s+', 
-        r'reported\s+by\s+',
-        r'author[:\s]+',
-        r'correspondent[:\s]+',
-        r'staff\s+writer[:\s]+',
-        r'byline[:\s]+',
-        r'\|\s+'  # Common separator in some news sites
-    ]
+journalist_prefilter = _compile_journalist_prefilter()
+journalist_prefilter_scratch = threading.local()  # Hyperscan scratch space can't be shared between threads
+
+# Hyperscan's caseless matching and \s don't agree with re's on non-ASCII text (re lets
+# [A-Z] match "İ" under IGNORECASE) or on the \x1c-\x1f separators re counts as
+# whitespace, so only text without those characters is left to the prefilter
+prefilter_unsafe_pattern = re.compile(r'[^\x00-\x1b\x20-\x7f]')
+
+def _may_contain_byline(text):
+    """Quickly rule out text with no byline candidate using the Hyperscan DFA"""
+    if journalist_prefilter is None or prefilter_unsafe_pattern.search(text):
+        return True
     
-    # More precise patterns that must include proper structure of a name
-    name_patterns = [
-        # Matches common name formats with proper capitalization
-        r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s+)?[A-Z][a-z]+(?:-[A-Z][a-z]+)?)',  # First (Middle) Last(-Last)
-        r'([A-Z][a-z]+\s+[a-z]+\s+[A-Z][a-z]+)',  # First van/de/la Last
-    ]
+    scratch = getattr(journalist_prefilter_scratch, 'scratch', None)
+    if scratch is None:
+        scratch = journalist_prefilter_scratch.scratch = hyperscan.Scratch(journalist_prefilter)
     
-    # Words that, if found in the match, likely indicate it's not a person's name
-    false_positives = [
-        'news', 'times', 'post', 'reuters', 'associated', 'press', 'agency',
-        'today', 'yesterday', 'tomorrow', 'google', 'facebook', 'twitter',
-        'breaking', 'exclusive', 'update', 'latest', 'report', 'copyright'
-    ]
+    found = []
+    def on_match(expression_id, start, end, flags, context):
+        found.append(expression_id)
+        return True  # Stop scanning at the first candidate
     
-    # First try more structured extraction from beginning/end of content
-    potential_authors = []
+    try:
+        journalist_prefilter.scan(text.encode(), match_event_handler=on_match, scratch=scratch)
+    except hyperscan.error:
+        pass  # Raised when the handler stops the scan early
+    return bool(found)
+
+def _find_journalist(text):
+    """Return the first valid name that follows a byline indicator in text"""
+    # Most text has no byline at all, which the prefilter can tell without the re scan
+    if not _may_contain_byline(text):
+        return None
     
+    for match in journalist_pattern.finditer(text):
+        potential_name = match.group(1)
+        if _is_valid_name(potential_name):
+            return potential_name
+    return None
+
+def extract_journalist(title, content=None):
+    """Attempt to extract journalist name if it exists in the title or content"""
     # Look at title first
-    for indicator in journalist_indicators:
-        for pattern in name_patterns:
-            # Look for indicator followed by name pattern
-            combined_pattern = f"{indicator}{pattern}"
-            matches = re.finditer(combined_pattern, title, re.IGNORECASE)
-            for match in matches:
-                potential_name = match.group(1)
-                # Validate the name
-                if _is_valid_name(potential_name, false_positives):
-                    print(f"Found author in title: {potential_name}")
-                    return potential_name
+    if title:
+        potential_name = _find_journalist(title)
+        if potential_name:
+            logger.debug("Found author in title: %s", potential_name)
+            return potential_name
     
     # If no match in title and content is provided, check content
     if not content:
         return None
         
     # Look in the first 500 characters (bylines often at the beginning)
-    content_start = content[:500]
-    
-    for indicator in journalist_indicators:
-        for pattern in name_patterns:
-            combined_pattern = f"{indicator}{pattern}"
-            matches = re.finditer(combined_pattern, content_start, re.IGNORECASE)
-            for match in matches:
-                potential_name = match.group(1)
-                if _is_valid_name(potential_name, false_positives):
-                    print(f"Found author at beginning of content: {potential_name}")
-                    return potential_name
+    potential_name = _find_journalist(content[:500])
+    if potential_name:
+        logger.debug("Found author at beginning of content: %s", potential_name)
+        return potential_name
     
     # Look in the last 500 characters (bylines often at the end)
     if len(content) > 500:
-        content_end = content[-500:]
-        
-        for indicator in journalist_indicators:
-            for pattern in name_patterns:
-                combined_pattern = f"{indicator}{pattern}"
-                matches = re.finditer(combined_pattern, content_end, re.IGNORECASE)
-                for match in matches:
-                    potential_name = match.group(1)
-                    if _is_valid_name(potential_name, false_positives):
-                        print(f"Found author at end of content: {potential_name}")
-                        return potential_name
+        potential_name = _find_journalist(content[-500:])
+        if potential_name:
+            logger.debug("Found author at end of content: %s", potential_name)
+            return potential_name
     
     return None
 
-def _is_valid_name(name, false_positives):
+def _is_valid_name(name):
     """Validate if a string really looks like a person's name"""
     # Check if it's too long to be a name
     if len(name) > 40:
         return False
         
     # Check for false positives
-    name_lower = name.lower()
-    for fp in false_positives:
-        if fp in name_lower:
-            return False
+    if false_positive_pattern.search(name):
+        return False
             
     # Check if it has reasonable word count for a name (1-4 words)
     words = name.split()
@@ -149,8 +325,149 @@ def _is_valid_name(name, false_positives):
         
     return True
 
-def fetch_article_details(url):
-    """Fetch detailed article information using newspaper3k"""
+# Common English words skipped when picking article keywords
+keyword_stopwords = frozenset([
+    'about', 'after', 'again', 'also', 'and', 'are', 'been', 'before', 'being', 'but',
+    'can', 'could', 'did', 'does', 'for', 'from', 'had', 'has', 'have', 'her', 'here',
+    'him', 'his', 'how', 'into', 'its', 'just', 'more', 'most', 'not', 'now', 'only',
+    'other', 'our', 'out', 'over', 'said', 'says', 'she', 'should', 'some', 'such',
+    'than', 'that', 'the', 'their', 'them', 'then', 'there', 'these', 'they', 'this',
+    'those', 'through', 'under', 'very', 'was', 'were', 'what', 'when', 'where', 'which',
+    'while', 'who', 'will', 'with', 'would', 'year', 'years', 'you', 'your'
+])
+
+keyword_token_pattern = re.compile(r"[^\W\d_]{3,}")
+
+def extract_keywords(text, limit=10):
+    """Pick the most frequent non-stopword tokens in text as keywords"""
+    tokens = (token for token in keyword_token_pattern.findall(text.lower()) if token not in keyword_stopwords)
+    return [word for word, _ in Counter(tokens).most_common(limit)]
+
+def _clip_article_text(text):
+    """Cut article text to article_text_limit without leaving a word fragment at the end"""
+    if len(text) <= article_text_limit:
+        return text
+    clipped = text[:article_text_limit]
+    if text[article_text_limit].isspace():
+        return clipped
+    # Back up to the last whitespace, unless the window is one unbroken token
+    parts = clipped.rsplit(None, 1)
+    return parts[0] if len(parts) > 1 else clipped
+
+def _json_ld_authors(data):
+    """Yield author names from a parsed JSON-LD object, however deeply nested"""
+    if isinstance(data, list):
+        for entry in data:
+            yield from _json_ld_authors(entry)
+    elif isinstance(data, dict):
+        author = data.get('author')
+        if isinstance(author, str):
+            yield author
+        elif isinstance(author, dict):
+            if isinstance(author.get('name'), str):
+                yield author['name']
+        elif isinstance(author, list):
+            for entry in author:
+                if isinstance(entry, str):
+                    yield entry
+                elif isinstance(entry, dict) and isinstance(entry.get('name'), str):
+                    yield entry['name']
+        # Some sites wrap everything in an @graph list
+        yield from _json_ld_authors(data.get('@graph'))
+
+def extract_structured_authors(doc):
+    """Read authors from the page's byline markup: meta tags, rel="author" links, then JSON-LD"""
+    candidates = doc.xpath('//meta[@name="author"]/@content')
+    if not candidates:
+        candidates = doc.xpath('//*[@rel="author"]/text()')
+    if not candidates:
+        for script in doc.xpath('//script[@type="application/ld+json"]/text()'):
+            try:
+                candidates.extend(_json_ld_authors(json.loads(script)))
+            except ValueError:
+                continue
+    
+    # Tidy up whitespace, drop profile URLs and keep the first occurrence of each name
+    authors = []
+    for candidate in candidates:
+        name = " ".join(candidate.split())
+        if name and not name.startswith('http') and name not in authors:
+            authors.append(name)
+    return authors
+
+def _download_article_details(url, want_keywords=False):
+    """Download an article and extract its details with trafilatura, falling back to newspaper3k"""
+    # Feed links point at Google News, so download the publisher's page they stand for.
+    # Resolving and downloading share one time budget, so a slow Google lookup can't
+    # hold a fetch worker for longer than a single article is allowed
+    deadline = time.monotonic() + article_request_timeout
+    article_url = resolve_google_news_url(url, deadline)
+    response = http_client.get(article_url, timeout=_time_left(deadline))
+    response.raise_for_status()
+    html = response.text
+    page_url = str(response.url)  # Where the page really lives, after redirects; relative links resolve against it
+    
+    # Parse the page once: byline markup is read straight off the tree, and
+    # trafilatura reuses the same tree instead of parsing the HTML again
+    doc = lxml.html.fromstring(response.content)
+    authors = extract_structured_authors(doc)
+    
+    # trafilatura extracts the main text and metadata with far less work than newspaper3k.
+    # no_fallback skips its extra readability/jusText passes, which only refine the
+    # full body text when we keep just the first part of it
+    extracted = trafilatura.extract(doc, url=page_url, no_fallback=True, with_metadata=True, output_format='json')
+    if extracted:
+        data = json.loads(extracted)
+        text = _clip_article_text(data.get('text') or '')
+        return {
+            'text': text[:1000],  # Limit text length
+            'top_image': urljoin(page_url, data['image']) if data.get('image') else '',  # trafilatura leaves it relative
+            'authors': authors or [author.strip() for author in (data.get('author') or '').split(';') if author.strip()],
+            'publish_date': data.get('date'),
+            'keywords': extract_keywords(text) if want_keywords else []
+        }
+    
+    # Fall back to newspaper3k on the HTML we already downloaded
+    logger.debug("trafilatura found no content, falling back to newspaper3k for: %s", page_url)
+    article = Article(page_url)
+    article.set_html(html)
+    article.parse()
+    
+    # Build result dict with extracted data
+    text = _clip_article_text(article.text or '')
+    return {
+        'text': text[:1000],  # Limit text length
+        'top_image': article.top_image,
+        'authors': authors or article.authors,
+        'publish_date': article.publish_date.strftime('%Y-%m-%d') if article.publish_date else None,
+        'keywords': extract_keywords(text) if want_keywords and text else []
+    }
+
+@lru_cache(maxsize=1024)
+def _cached_article_details(url, want_keywords=False):
+    """Return article details for a URL, shared across queries and instances through Redis"""
+    # Failed downloads raise instead of returning, so they are never cached and get retried
+    cache_key = ("art:kw:" if want_keywords else "art:") + hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    if redis_client is not None:
+        try:
+            raw = redis_client.get(cache_key)
+            if raw:
+                return json.loads(raw)
+        except redis.RedisError as e:
+            logger.warning("Redis article cache read error: %s", e)
+    
+    result = _download_article_details(url, want_keywords)
+    
+    if redis_client is not None:
+        try:
+            redis_client.setex(cache_key, article_cache_expiry, json.dumps(result))
+        except redis.RedisError as e:
+            logger.warning("Redis article cache write error: %s", e)
+    
+    return result
+
+def fetch_article_details(url, want_keywords=False):
+    """Fetch detailed article information, reusing cached results for URLs seen before"""
     if not url or url == '#':
         return {
             'text': '',
@@ -161,31 +478,10 @@ def fetch_article_details(url):
         }
     
     try:
-        # Configure newspaper
-        article = Article(url)
-        article.download()
-        article.parse()
-        
-        # Try to extract NLP features if possible
-        try:
-            article.nlp()
-        except Exception as e:
-            print(f"NLP extraction error: {e}")
-            
-        # Build result dict with extracted data
-        result = {
-            'text': article.text[:1000] if article.text else '',  # Limit text length
-            'top_image': article.top_image,
-            'authors': article.authors,
-            'publish_date': article.publish_date,
-            'keywords': article.keywords if hasattr(article, 'keywords') else []
-        }
-        
-        return result
+        return _cached_article_details(url, want_keywords)
         
     except Exception as e:
-        print(f"Error fetching article details: {e}")
-        traceback.print_exc()
+        logger.warning("Error fetching article details for %s: %s", url, e, exc_info=True)
         return {
             'text': '',
             'top_image': '',
@@ -194,368 +490,597 @@ def fetch_article_details(url):
             'keywords': []
         }
 
+def merge_article_details(article_data, article_details):
+    """Update an article entry in place with the fetched article details"""
+    description = article_data['description']
+    
+    if article_details['text']:
+        # Use the fuller article text if available
+        article_data['full_text'] = article_details['text']
+        
+        # Use article text as description if current one is short or improve longer descriptions
+        if len(description) < 100:
+            article_data['description'] = article_details['text'][:400] + "..."
+        elif len(description) < 250:
+            # Append a bit more content to make description richer
+            article_data['description'] = description + "\n\n" + article_details['text'][:200] + "..."
+    
+    # Update with image
+    if article_details['top_image']:
+        article_data['image_url'] = article_details['top_image']
+    
+    # Update with authors from the article page
+    if article_details['authors']:
+        article_data['journalist'] = ", ".join(article_details['authors'][:3])  # Limit to first 3 authors
+        logger.debug("Authors found on article page: %s", article_data['journalist'])
+    
+    # Update with published date if available and original is Unknown
+    if article_details['publish_date'] and article_data['date'] == "Unknown":
+        article_data['date'] = article_details['publish_date']
+    
+    # Add keywords if available
+    if article_details['keywords']:
+        article_data['keywords'] = article_details['keywords'][:10]  # Limit to top 10 keywords
+
+def fetch_article_details_batch(links, want_keywords=False):
+    """Fetch details for {index: link} pairs, returning {index: details} for those that finished in time"""
+    if len(links) == 1:
+        # A single article gains nothing from the pool, so fetch it on the request thread
+        (idx, link), = links.items()
+        return {idx: fetch_article_details(link, want_keywords)}
+    
+    # Fetch all links concurrently so the network waits overlap instead of adding up
+    details = {}
+    futures = {article_executor.submit(fetch_article_details, link, want_keywords): idx for idx, link in links.items()}
+    try:
+        for future in as_completed(futures, timeout=article_fetch_timeout):
+            try:
+                details[futures[future]] = future.result()
+            except Exception as e:
+                logger.exception("Error processing detailed article info: %s", e)
+    except TimeoutError:
+        # Don't let one slow host stall the whole response
+        pending = sum(1 for future in futures if not future.done())
+        logger.warning("Timed out waiting for %d article(s), returning basic info for them", pending)
+    finally:
+        # Drop downloads that haven't started yet so they don't hold up other requests
+        for future in futures:
+            future.cancel()
+    
+    return details
+
+def build_article(item, article_details=None):
+    """Build the API entry for one Google News result, merging fetched article details if any"""
+    # Extract basic data from the feed entry
+    title = item.get('title', 'No title')
+    description = item.get('description', 'No description available')
+    link = item.get('url', '#')
+    
+    logger.debug("Processing article: %s", title)
+    
+    # Extract publication from publisher info
+    publisher_info = item.get('publisher', {})
+    publication = publisher_info.get('title', 'Unknown Source')
+    
+    # Use the feed's publication date string as is
+    date = item.get('published date') or "Unknown"
+    
+    article_data = {
+        'title': title,
+        'description': description,
+        'date': date,
+        'link': link,
+        'publication': publication,
+        'journalist': None  # Will update if we fetch detailed info
+    }
+    
+    if article_details:
+        merge_article_details(article_data, article_details)
+    
+    # Extract journalist name only if the article page didn't list any authors,
+    # since the byline regex scan is the most expensive step left per article
+    if article_data['journalist'] is None:
+        # Try to extract from title first, then from content if available
+        full_text = article_data.get('full_text', '')
+        journalist = extract_journalist(title, full_text) if title or full_text else None
+        # Clients expect a string, so fall back to the placeholder text here
+        article_data['journalist'] = journalist or "Not specified"
+    
+    return article_data
+
+def _html_to_text(html):
+    """Strip the markup from a feed description"""
+    if not html or not html.strip():
+        return ''
+    try:
+        return lxml.html.fromstring(html).text_content().replace('\xa0', ' ')
+    except (etree.ParserError, ValueError):
+        # Markup with no content at all (e.g. only a comment), or a str carrying
+        # an encoding declaration, which lxml refuses to parse
+        return ''
+
+def _iter_feed_entries(content, content_type):
+    """Yield the items of an RSS feed in GNews' result shape, parsed with lxml, falling back to feedparser for malformed XML"""
+    try:
+        root = etree.fromstring(content)
+    except etree.XMLSyntaxError as e:
+        logger.warning("Malformed feed XML, falling back to feedparser: %s", e)
+        # Pass the declared content type so feedparser can skip sniffing the encoding
+        feed = feedparser.parse(content, response_headers={'content-type': content_type})
+        for entry in feed.entries:
+            yield {
+                'title': entry.get('title', ''),
+                'description': entry.get('description', ''),
+                'published date': entry.get('published', ''),
+                'url': entry.get('link'),
+                'publisher': entry.get('source', {})
+            }
+        return
+    
+    for item in root.iterfind('channel/item'):
+        source = item.find('source')
+        yield {
+            'title': item.findtext('title', ''),
+            'description': item.findtext('description', ''),
+            'published date': item.findtext('pubDate', ''),
+            'url': item.findtext('link'),
+            'publisher': {'href': source.get('url'), 'title': source.text} if source is not None else {}
+        }
+
+def _get_feed(rss_url):
+    """Download a feed, retrying connection errors, timeouts and gateway errors with a short backoff"""
+    for attempt in range(feed_fetch_retries + 1):
+        if attempt:
+            time.sleep(feed_retry_backoff * 2 ** (attempt - 1))
+        try:
+            response = http_client.get(rss_url, timeout=feed_request_timeout)
+        except httpx.TransportError as e:
+            if attempt == feed_fetch_retries:
+                raise
+            logger.info("Retrying feed fetch after error: %s", e)
+            continue
+        
+        if response.status_code in feed_retry_statuses and attempt < feed_fetch_retries:
+            logger.info("Retrying feed fetch after HTTP %d", response.status_code)
+            continue
+        response.raise_for_status()
+        return response
+
+def fetch_google_news(query, language, country, period, max_results):
+    """Search the Google News RSS feed, returning results in the same shape GNews did"""
+    search = f"{query} when:{period}" if period else query
+    rss_url = google_news_rss_template.format(
+        query=quote(search, safe=''),
+        language=quote(language, safe=''),
+        country=quote(country, safe='')
+    )
+    try:
+        response = _get_feed(rss_url)
+    except httpx.HTTPError as e:
+        logger.warning("Google News feed unavailable: %s", e)
+        return []
+
+    content_type = response.headers.get('content-type', 'application/rss+xml; charset=utf-8')
+    
+    # The feed can list the same story more than once, so keep only the first
+    # entry per link and stop as soon as enough unique results are collected.
+    # Entries are streamed straight into the results, with no intermediate list.
+    # Entries without a link can't be opened or fetched, so they're skipped
+    results = []
+    seen_links = set()
+    for entry in _iter_feed_entries(response.content, content_type):
+        link = entry['url']
+        if not link or link in seen_links:
+            continue
+        seen_links.add(link)
+        entry['description'] = _html_to_text(entry['description'])
+        results.append(entry)
+        if len(results) >= max_results:
+            break
+    
+    return results
+
+def fetch_news_articles(query, language, country, period, max_articles, detailed_mode, want_keywords=False):
+    """Search Google News for a query and build the article entries, fetching details if requested"""
+    logger.info("Searching with filters - Language: %s, Country: %s, Period: %s", language, country, period)
+
+    try:
+        # Search for the query
+        logger.info("Searching for: %s", query)
+        news_results = fetch_google_news(query, language, country, period, max_articles)
+        logger.info("Total articles fetched: %d", len(news_results))
+        
+    except Exception as e:
+        logger.exception("Error fetching news: %s", e)
+        raise
+
+    # Process the results
+    if not news_results:
+        logger.info("No articles found for query: %s", query)
+        return []
+        
+    # Log a sample of the first article
+    if logger.isEnabledFor(logging.DEBUG):
+        first = news_results[0]
+        logger.debug(
+            "Sample article - Title: %s | Link: %s | Publisher: %s | Published At: %s | Description: %s",
+            first.get('title', 'No title'),
+            first.get('url', 'No link'),
+            first.get('publisher', {}).get('title', 'Unknown'),
+            first.get('published date', 'No date'),
+            first.get('description', 'No description')
+        )
+        
+    # If detailed mode is enabled, collect the links that need article details
+    to_fetch = {}
+    if detailed_mode:
+        for idx, item in enumerate(news_results):
+            link = item.get('url', '#')
+            if link and link != '#':
+                to_fetch[idx] = link
+    
+    article_details = {}
+    if to_fetch:
+        logger.info("Fetching detailed information for %d articles", len(to_fetch))
+        start_time = time.time()
+        article_details = fetch_article_details_batch(to_fetch, want_keywords)
+        elapsed_time = time.time() - start_time
+        logger.info("Article details fetched in %.2f seconds", elapsed_time)
+    
+    return [build_article(item, article_details.get(idx)) for idx, item in enumerate(news_results)]
+
+def json_response(data, status=200):
+    """Encode data with orjson into a JSON response, in place of Flask's jsonify"""
+    return app.response_class(orjson.dumps(data), status=status, mimetype='application/json')
+
+def news_response(body, etag):
+    """Wrap an encoded news body in a response with its ETag, answering 304 when the client already has it"""
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'max-age={cache_expiry}'
+    return response.make_conditional(request)
+
 @app.route('/news/<query>')
+@limiter.limit("5 per minute")
 def get_news(query):
     try:        # Get number of articles from query parameters (default to 30)
         max_articles = request.args.get('articles', default=30, type=int)
         # Limit to reasonable range
         max_articles = min(max(1, max_articles), 100)  # Between 1 and 100 articles
         
-        # Get if detailed mode is enabled (uses newspaper3k to fetch full article content)
+        # Get if detailed mode is enabled (downloads and parses the full article content)
         detailed_mode = request.args.get('detailed', default=True, type=lambda v: v.lower() == 'true')
         
+        # Keyword extraction is opt-in, since most clients never show keywords
+        want_keywords = request.args.get('keywords', default=False, type=lambda v: v.lower() == 'true')
+        
         # Get language, country and time period from query parameters
         language = request.args.get('language', default='en', type=str)
         country = request.args.get('country', default='IN', type=str)
         period = request.args.get('period', default='1d', type=str)
         
-        # Check cache first
-        cache_key = f"{query}_{language}_{country}_{period}_{max_articles}_{detailed_mode}"
-        
-        # Clean expired cache entries
-        cleanup_cache()
-        
-        # Check if we have a cached result
-        if cache_key in news_cache:
-            timestamp, cached_results = news_cache[cache_key]
-            if time.time() - timestamp <= cache_expiry:
-                print(f"Returning cached results for: {query}")
-                return jsonify(cached_results)
-        
-        print(f"Searching with filters - Language: {language}, Country: {country}, Period: {period}")
-        
-        # Initialize GNews
-        gnews_client = GNews(
-            language=language,
-            country=country,
-            max_results=max_articles,
-            period=period  # Time period for news
-        )
-        
-        try:
-            # Search for the query
-            print(f"Searching for: {query}")
-            news_results = gnews_client.get_news(query)
-            print(f"Total articles fetched: {len(news_results)}")
-            
-        except Exception as e:
-            print(f"Error fetching news: {e}")
-            traceback.print_exc()
-            raise
-
-        # Process the results
-        if not news_results:
-            print(f"No articles found for query: {query}")
-            return jsonify({
-                "error": "No articles found",
-                "message": "Try a different search term.",
-                "articles": []
-            })
-            
-        # Print summary of results
-        print(f"\nTotal articles found: {len(news_results)}")
-        print("===================================")
+        # Check cache first, keyed on the search arguments themselves
+        cache_key = (query, language, country, period, max_articles, detailed_mode, want_keywords)
+        cached = get_cached_news(cache_key)
+        if cached is not None:
+            logger.info("Returning cached results for: %s", query)
+            return news_response(*cached)
         
-        # Print sample of first article
-        if news_results:
-            first = news_results[0]
-            print("Sample article:")
-            print('Title:', first.get('title', 'No title'))
-            print('Link:', first.get('url', 'No link'))
-            print('Publisher:', first.get('publisher', {}).get('title', 'Unknown'))
-            print('Published At:', first.get('published date', 'No date'))
-            print('Description:', first.get('description', 'No description'))
-            print("===================================")
-            
-        articles = []
-        
-        for item in news_results:
-            # Extract basic data from GNews
-            title = item.get('title', 'No title')
-            description = item.get('description', 'No description available')
-            link = item.get('url', '#')
-            
-            print(f"\nProcessing article: {title}")
-            
-            # Extract publication from publisher info
-            publisher_info = item.get('publisher', {})
-            publication = publisher_info.get('title', 'Unknown Source')
-            
-            # Parse date if available
-            date_str = item.get('published date', '')
-            if date_str:
-                try:
-                    date = date_str
-                except Exception as e:
-                    print(f"Date parsing error: {e}")
-                    date = date_str
-            else:
-                date = "Unknown"
-            
-            article_data = {
-                'title': title,
-                'description': description,
-                'date': date,
-                'link': link,
-                'publication': publication,
-                'journalist': "Not specified"  # Will update if we fetch detailed info
-            }
-              # If detailed mode is enabled, fetch additional info using newspaper3k
-            if detailed_mode and link and link != '#':
-                try:
-                    print(f"Fetching detailed information for: {link}")
-                    start_time = time.time()
-                    article_details = fetch_article_details(link)
-                    elapsed_time = time.time() - start_time
-                    print(f"Article details fetched in {elapsed_time:.2f} seconds")
-                    
-                    # Update with detailed information
-                    if article_details['text']:
-                        # Use the fuller article text from newspaper3k if available
-                        article_data['full_text'] = article_details['text']
-                        
-                        # Use article text as description if current one is short or improve longer descriptions
-                        if len(description) < 100 and article_details['text']:
-                            article_data['description'] = article_details['text'][:400] + "..."
-                        elif len(description) < 250 and article_details['text']:
-                            # Append a bit more content to make description richer
-                            article_data['description'] = description + "\n\n" + article_details['text'][:200] + "..."
-                    
-                    # Update with image
-                    if article_details['top_image']:
-                        article_data['image_url'] = article_details['top_image']
-                    
-                    # Update with authors from newspaper3k
-                    if article_details['authors']:
-                        article_data['journalist'] = ", ".join(article_details['authors'][:3])  # Limit to first 3 authors
-                        print(f"Authors found via newspaper3k: {article_data['journalist']}")
-                    
-                    # Update with published date if available and original is Unknown
-                    if article_details['publish_date'] and date == "Unknown":
-                        try:
-                            article_data['date'] = article_details['publish_date'].strftime('%Y-%m-%d')
-                        except:
-                            pass
-                    
-                    # Add keywords if available
-                    if article_details['keywords']:
-                        article_data['keywords'] = article_details['keywords'][:10]  # Limit to top 10 keywords
-                
-                except Exception as e:
-                    print(f"Error processing detailed article info: {e}")
-                    traceback.print_exc()
-            
-            # Extract journalist name if possible and not already set from newspaper3k
-            if article_data['journalist'] == "Not specified":                # Try to extract from title first, then from content if available
-                full_text = article_data.get('full_text', '')
-                journalist = extract_journalist(title, full_text)
-                if journalist:
-                    article_data['journalist'] = journalist
-            
-            articles.append(article_data)
+        articles = fetch_news_articles(query, language, country, period, max_articles, detailed_mode, want_keywords)
         
         if not articles:
-            return jsonify({
+            return json_response({
                 "error": "No articles found",
-                "message": "Please try with a different search term.",
+                "message": "Try a different search term.",
                 "articles": []
             })
         
-        # Store results in cache before returning
-        news_cache[cache_key] = (time.time(), articles)
+        # Encode and hash once, caching the bytes with their ETag, so cache hits
+        # skip both serialization and hashing entirely
+        body = orjson.dumps(articles)
+        etag = news_etag(body)
+        set_cached_news(cache_key, body, etag)
         
-        return jsonify(articles)
+        return news_response(body, etag)
         
     except Exception as e:
-        print(f"Error in get_news: {str(e)}")
+        logger.error("Error in get_news: %s", e)
         error_message = "An error occurred while fetching news articles."
         if "GoogleNews" in str(e):
             error_message = "Error fetching news from source. Please try again."
-        return jsonify({
+        return json_response({
             "error": error_message,
             "details": str(e) if app.debug else None
-        }), 500
+        }, 500)
+
+# Static API description, encoded once at import instead of on every request
+api_info_body = orjson.dumps({
+    "name": "News Scraper API",
+    "version": "1.0.0",
+    "available_endpoints": [
+        {"path": "/", "method": "GET", "description": "This information page"},
+        {
+            "path": "/news/<query>", 
+            "method": "GET", 
+            "description": "Get news articles based on search query",                "parameters": {
+                "articles": "Optional: Number of articles to fetch (default: 30, max: 100)",
+                "language": "Optional: Language code (default: 'en')",
+                "country": "Optional: Country code (default: 'IN')",
+                "period": "Optional: Time period for news (default: '1d')",
+                "keywords": "Optional: Set to 'true' to include article keywords in detailed mode (default: false)"
+            },
+            "example": "/news/technology?language=en&country=US&period=7d"
+        },
+        {"path": "/options", "method": "GET", "description": "Get available options for languages, countries and time periods"},
+        {"path": "/health", "method": "GET", "description": "Health check endpoint"}
+    ],
+    "usage": "Make GET requests to /news/your_search_query to retrieve news articles"
+})
 
 @app.route('/')
 def index():
     """Root endpoint that provides API information"""
-    return jsonify({
-        "name": "News Scraper API",
-        "version": "1.0.0",
-        "available_endpoints": [
-            {"path": "/", "method": "GET", "description": "This information page"},
-            {
-                "path": "/news/<query>", 
-                "method": "GET", 
-                "description": "Get news articles based on search query",                "parameters": {
-                    "articles": "Optional: Number of articles to fetch (default: 30, max: 100)",
-                    "language": "Optional: Language code (default: 'en')",
-                    "country": "Optional: Country code (default: 'IN')",
-                    "period": "Optional: Time period for news (default: '1d')"
-                },
-                "example": "/news/technology?language=en&country=US&period=7d"
-            },
-            {"path": "/options", "method": "GET", "description": "Get available options for languages, countries and time periods"},
-            {"path": "/health", "method": "GET", "description": "Health check endpoint"}
-        ],
-        "usage": "Make GET requests to /news/your_search_query to retrieve news articles"
-    })
+    return app.response_class(api_info_body, mimetype='application/json')
+
+health_body = orjson.dumps({"status": "OK"})
 
 @app.route('/health')
 def health_check():
-    return jsonify({"status": "OK"})
+    return app.response_class(health_body, mimetype='application/json')
+
+# The language, country and period options never change, so encode them once at import
+options_body = orjson.dumps({
+    "languages": {
+        # Primary languages for the app
+        "en": "English",
+        "hi": "Hindi",
+        "te": "Telugu",
+        "ta": "Tamil",
+        "ml": "Malayalam",
+        "bn": "Bengali",
+        "mr": "Marathi",
+        
+        # Other languages supported by Google News but not shown in the dropdown
+        "id": "Indonesian",
+        "cs": "Czech",
+        "de": "German",
+        "es-419": "Spanish",
+        "fr": "French",
+        "it": "Italian",
+        "lv": "Latvian",
+        "lt": "Lithuanian",
+        "hu": "Hungarian",
+        "nl": "Dutch",
+        "no": "Norwegian",
+        "pl": "Polish",
+        "pt-419": "Portuguese (Brazil)",
+        "pt-150": "Portuguese (Portugal)",
+        "ro": "Romanian",
+        "sk": "Slovak",
+        "sl": "Slovenian",
+        "sv": "Swedish",
+        "vi": "Vietnamese",
+        "tr": "Turkish",
+        "el": "Greek",
+        "bg": "Bulgarian",
+        "ru": "Russian",
+        "sr": "Serbian",
+        "uk": "Ukrainian",
+        "he": "Hebrew",
+        "ar": "Arabic",
+        "th": "Thai",
+        "zh-Hans": "Chinese (Simplified)",
+        "zh-Hant": "Chinese (Traditional)",
+        "ja": "Japanese",
+        "ko": "Korean"
+    },
+    "countries": {
+        "AU": "Australia",
+        "BW": "Botswana",
+        "CA": "Canada",
+        "ET": "Ethiopia",
+        "GH": "Ghana",
+        "IN": "India",
+        "ID": "Indonesia",
+        "IE": "Ireland",
+        "IL": "Israel",
+        "KE": "Kenya",
+        "LV": "Latvia",
+        "MY": "Malaysia",
+        "NA": "Namibia",
+        "NZ": "New Zealand",
+        "NG": "Nigeria",
+        "PK": "Pakistan",
+        "PH": "Philippines",
+        "SG": "Singapore",
+        "ZA": "South Africa",
+        "TZ": "Tanzania",
+        "UG": "Uganda",
+        "GB": "United Kingdom",
+        "US": "United States",
+        "ZW": "Zimbabwe",
+        "CZ": "Czech Republic",
+        "DE": "Germany",
+        "AT": "Austria",
+        "CH": "Switzerland",
+        "AR": "Argentina",
+        "CL": "Chile",
+        "CO": "Colombia",
+        "CU": "Cuba",
+        "MX": "Mexico",
+        "PE": "Peru",
+        "VE": "Venezuela",
+        "BE": "Belgium",
+        "FR": "France",
+        "MA": "Morocco",
+        "SN": "Senegal",
+        "IT": "Italy",
+        "LT": "Lithuania",
+        "HU": "Hungary",
+        "NL": "Netherlands",
+        "NO": "Norway",
+        "PL": "Poland",
+        "BR": "Brazil",
+        "PT": "Portugal",
+        "RO": "Romania",
+        "SK": "Slovakia",
+        "SI": "Slovenia",
+        "SE": "Sweden",
+        "VN": "Vietnam",
+        "TR": "Turkey",
+        "GR": "Greece",
+        "BG": "Bulgaria",
+        "RU": "Russia",
+        "UA": "Ukraine",
+        "RS": "Serbia",
+        "AE": "United Arab Emirates",
+        "SA": "Saudi Arabia",
+        "LB": "Lebanon",
+        "EG": "Egypt",
+        "BD": "Bangladesh",
+        "TH": "Thailand",
+        "CN": "China",
+        "TW": "Taiwan",
+        "HK": "Hong Kong",
+        "JP": "Japan",
+        "KR": "Republic of Korea"
+    },
+    "periods": {
+        "1h": "Past hour",
+        "12h": "Past 12 hours",
+        "1d": "Past day",
+        "3d": "Past 3 days",
+        "7d": "Past week",
+        "1m": "Past month"
+    }
+})
 
 @app.route('/options')
 def get_options():
     """Returns available options for language, country, and time period"""
-    return jsonify({
-        "languages": {
-            # Primary languages for the app
-            "en": "English",
-            "hi": "Hindi",
-            "te": "Telugu",
-            "ta": "Tamil",
-            "ml": "Malayalam",
-            "bn": "Bengali",
-            "mr": "Marathi",
-            
-            # Other languages supported by GNews but not shown in the dropdown
-            "id": "Indonesian",
-            "cs": "Czech",
-            "de": "German",
-            "es-419": "Spanish",
-            "fr": "French",
-            "it": "Italian",
-            "lv": "Latvian",
-            "lt": "Lithuanian",
-            "hu": "Hungarian",
-            "nl": "Dutch",
-            "no": "Norwegian",
-            "pl": "Polish",
-            "pt-419": "Portuguese (Brazil)",
-            "pt-150": "Portuguese (Portugal)",
-            "ro": "Romanian",
-            "sk": "Slovak",
-            "sl": "Slovenian",
-            "sv": "Swedish",
-            "vi": "Vietnamese",
-            "tr": "Turkish",
-            "el": "Greek",
-            "bg": "Bulgarian",
-            "ru": "Russian",
-            "sr": "Serbian",
-            "uk": "Ukrainian",
-            "he": "Hebrew",
-            "ar": "Arabic",
-            "th": "Thai",
-            "zh-Hans": "Chinese (Simplified)",
-            "zh-Hant": "Chinese (Traditional)",
-            "ja": "Japanese",
-            "ko": "Korean"
-        },
-        "countries": {
-            "AU": "Australia",
-            "BW": "Botswana",
-            "CA": "Canada",
-            "ET": "Ethiopia",
-            "GH": "Ghana",
-            "IN": "India",
-            "ID": "Indonesia",
-            "IE": "Ireland",
-            "IL": "Israel",
-            "KE": "Kenya",
-            "LV": "Latvia",
-            "MY": "Malaysia",
-            "NA": "Namibia",
-            "NZ": "New Zealand",
-            "NG": "Nigeria",
-            "PK": "Pakistan",
-            "PH": "Philippines",
-            "SG": "Singapore",
-            "ZA": "South Africa",
-            "TZ": "Tanzania",
-            "UG": "Uganda",
-            "GB": "United Kingdom",
-            "US": "United States",
-            "ZW": "Zimbabwe",
-            "CZ": "Czech Republic",
-            "DE": "Germany",
-            "AT": "Austria",
-            "CH": "Switzerland",
-            "AR": "Argentina",
-            "CL": "Chile",
-            "CO": "Colombia",
-            "CU": "Cuba",
-            "MX": "Mexico",
-            "PE": "Peru",
-            "VE": "Venezuela",
-            "BE": "Belgium",
-            "FR": "France",
-            "MA": "Morocco",
-            "SN": "Senegal",
-            "IT": "Italy",
-            "LT": "Lithuania",
-            "HU": "Hungary",
-            "NL": "Netherlands",
-            "NO": "Norway",
-            "PL": "Poland",
-            "BR": "Brazil",
-            "PT": "Portugal",
-            "RO": "Romania",
-            "SK": "Slovakia",
-            "SI": "Slovenia",
-            "SE": "Sweden",
-            "VN": "Vietnam",
-            "TR": "Turkey",
-            "GR": "Greece",
-            "BG": "Bulgaria",
-            "RU": "Russia",
-            "UA": "Ukraine",
-            "RS": "Serbia",
-            "AE": "United Arab Emirates",
-            "SA": "Saudi Arabia",
-            "LB": "Lebanon",
-            "EG": "Egypt",
-            "BD": "Bangladesh",
-            "TH": "Thailand",
-            "CN": "China",
-            "TW": "Taiwan",
-            "HK": "Hong Kong",
-            "JP": "Japan",
-            "KR": "Republic of Korea"
-        },
-        "periods": {
-            "1h": "Past hour",
-            "12h": "Past 12 hours",
-            "1d": "Past day",
-            "3d": "Past 3 days",
-            "7d": "Past week",
-            "1m": "Past month"
-        }
-    })
+    return app.response_class(options_body, mimetype='application/json')
 
 @app.errorhandler(404)
 def not_found(e):
     """Handle 404 errors with a friendly message"""
-    return jsonify({
+    return json_response({
         "error": "Endpoint not found",
         "message": "The requested URL was not found on this server. Make sure you're using a valid endpoint.",
         "available_endpoints": ["/", "/news/<query>", "/options", "/health"]
-    }), 404
+    }, 404)
+
+@app.errorhandler(429)
+def rate_limited(e):
+    """Handle rate limit errors with a JSON message"""
+    return json_response({
+        "error": "Too many requests",
+        "message": f"Rate limit exceeded ({e.description}). Please try again later."
+    }, 429)
+
+# Publisher URL embedded in the protobuf payload of older Google News article links
+embedded_url_pattern = re.compile(rb'https?://[\x21-\x7e]+')
+
+# Newer links only resolve through Google's own decoding endpoint
+google_news_article_url = "https://news.google.com/articles/{encoded}"
+google_news_batchexecute_url = "https://news.google.com/_/DotsSplashUi/data/batchexecute"
+google_news_decode_retry_after = 300  # Seconds before retrying a link Google failed to decode
+
+# Resolved links rarely change, failures are remembered briefly so repeated searches
+# don't keep hitting Google's rate-limited endpoint for the same links
+google_news_url_cache = TTLCache(maxsize=4096, ttl=article_cache_expiry)
+google_news_decode_failures = TTLCache(maxsize=1024, ttl=google_news_decode_retry_after)
+google_news_url_cache_lock = threading.Lock()  # TTLCache isn't thread-safe
+
+def _decode_google_news_url_locally(source_url):
+    """Decode a Google News article link without any network calls, or return None"""
+    url = urlparse(source_url)
+    path = url.path.split('/')
+    if 'articles' not in path[:-1]:
+        return None
+    
+    encoded = path[path.index('articles') + 1]
+    try:
+        decoded_bytes = base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4))
+    except ValueError:
+        return None
+    
+    match = embedded_url_pattern.search(decoded_bytes)
+    return match.group(0).decode('ascii') if match else None
+
+def _decode_google_news_url_remotely(source_url, deadline):
+    """Ask Google to decode a Google News article link, over the shared HTTP client"""
+    encoded = urlparse(source_url).path.rstrip('/').split('/')[-1]
+    
+    # The article page carries the signature and timestamp the decoding endpoint requires
+    response = http_client.get(google_news_article_url.format(encoded=encoded), timeout=_time_left(deadline))
+    response.raise_for_status()
+    params = lxml.html.fromstring(response.content).xpath('//c-wiz/div[@jscontroller]')
+    if not params:
+        raise ValueError("Google News article page has no decoding parameters")
+    signature = params[0].get('data-n-a-sg')
+    timestamp = params[0].get('data-n-a-ts')
+    
+    payload = [
+        "Fbv4je",
+        f'["garturlreq",[["X","X",["X","X"],null,null,1,1,"US:en",null,1,null,null,null,null,null,0,1],"X","X",1,[1,1,1],1,1,null,0,0,null,0],"{encoded}",{timestamp},"{signature}"]'
+    ]
+    response = http_client.post(
+        google_news_batchexecute_url,
+        data={'f.req': json.dumps([[payload]])},
+        timeout=_time_left(deadline)
+    )
+    response.raise_for_status()
+    try:
+        rows = json.loads(response.text.split("\n\n")[1])[:-2]
+        return json.loads(rows[0][2])[1]
+    except (ValueError, IndexError, TypeError) as e:
+        raise ValueError(f"Unexpected Google News decoding response: {e}")
+
+def resolve_google_news_url(source_url, deadline=None):
+    """Return the publisher URL behind a Google News link, raising ValueError if it can't be resolved"""
+    if urlparse(source_url).hostname != 'news.google.com':
+        return source_url
+    
+    decoded_url = _decode_google_news_url_locally(source_url)
+    if decoded_url:
+        return decoded_url
+    
+    with google_news_url_cache_lock:
+        decoded_url = google_news_url_cache.get(source_url)
+        failure = google_news_decode_failures.get(source_url)
+    if decoded_url:
+        return decoded_url
+    if failure:
+        raise ValueError(failure)
+    
+    # Newer links no longer embed the URL, so ask Google to resolve them
+    if deadline is None:
+        deadline = time.monotonic() + article_request_timeout
+    try:
+        decoded_url = _decode_google_news_url_remotely(source_url, deadline)
+    except (httpx.HTTPError, ValueError) as e:
+        with google_news_url_cache_lock:
+            google_news_decode_failures[source_url] = f"Unable to decode Google News URL: {e}"
+        raise ValueError(f"Unable to decode Google News URL: {e}") from e
+    
+    with google_news_url_cache_lock:
+        google_news_url_cache[source_url] = decoded_url
+    return decoded_url
 
 @app.route('/decode_url', methods=['POST'])
 def decode_url():
     data = request.get_json()
     url = data.get('url')
     if not url:
-        return jsonify({'error': 'No URL provided'}), 400
+        return json_response({'error': 'No URL provided'}, 400)
     try:
-        decoded_url = decode_google_news_url(url)
-        return jsonify({'decoded_url': decoded_url})
+        decoded_url = resolve_google_news_url(url)
+        return json_response({'decoded_url': decoded_url})
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s %(levelname)s %(name)s: %(message)s')
     print("News Scraper API running...")
     print("Available endpoints:")
     print("  - / : API information")
@@ -7,9 +7,15 @@ echo "Starting build process..."
 echo "Installing dependencies from requirements.txt..."
 pip install -r requirements.txt
 
-# Run NLTK setup script
-echo "Setting up NLTK data..."
-python api/nltk_setup.py
+# NLTK punkt is only needed for newspaper3k's article.nlp(), which the API no
+# longer calls, so the download is opt-in. When enabled it lands in ./nltk_data
+# and ships with the build instead of being fetched on a cold start.
+if [ "${ENABLE_NLTK_SETUP:-false}" = "true" ]; then
+  echo "Setting up NLTK data..."
+  python api/nltk_setup.py
+else
+  echo "Skipping NLTK data setup (set ENABLE_NLTK_SETUP=true to bundle punkt)"
+fi
 
 # Verify critical installations
 echo "Verifying installations..."